@@ -2,52 +2,45 @@ import requests
 
 BASE = "http://127.0.0.1:8000"
 
+# One Session for the whole demo so requests reuse the same
+# keep-alive connections instead of opening a new one each time.
+session = requests.Session()
+
 # -----------------
 # Add / POST
 # -----------------
 
 print("\n=== ADD TICKETS ===")
 
-# HTTP request is sent (Python to JSON)
-resp = requests.post(
-    f"{BASE}/tickets/",
-    json={
+new_tickets = [
+    {
         "title": "Printer not working",
         "description": "Office printer keeps jamming",
         "priority": 3
     },
-)
-print("\nAdd ticket 1:")
-print("Status:", resp.status_code)
-# json() converts from JSON to Python
-ticket1 = resp.json()
-print("Response:", ticket1)
-
-resp = requests.post(
-    f"{BASE}/tickets/",
-    json={
+    {
         "title": "Laptop overheating",
         "description": "Fan is loud and laptop shuts down",
         "priority": 5
     },
-)
-print("\nAdd ticket 2:")
-print("Status:", resp.status_code)
-ticket2 = resp.json()
-print("Response:", ticket2)
-
-resp = requests.post(
-    f"{BASE}/tickets/",
-    json={
+    {
         "title": "Email not syncing",
         "description": "Outlook not updating inbox",
         "priority": 2
     },
-)
-print("\nAdd ticket 3:")
+]
+
+# HTTP request is sent (Python to JSON)
+# All three tickets are created in one request (and one DB transaction)
+resp = session.post(f"{BASE}/tickets/bulk", json=new_tickets)
+print("\nAdd tickets 1-3:")
 print("Status:", resp.status_code)
-ticket3 = resp.json()
-print("Response:", ticket3)
+# json() converts from JSON to Python
+created = resp.json()
+for ticket in created:
+    print("Response:", ticket)
+
+ticket1, ticket2, ticket3 = created
 
 # -----------------
 # Update / PATCH
@@ -55,7 +48,7 @@ print("Response:", ticket3)
 
 print("\n=== PATCH TICKET ===")
 
-resp = requests.patch(
+resp = session.patch(
     f"{BASE}/tickets/{ticket1['id']}",
     json={"status": "in_progress"},
 )
@@ -70,7 +63,7 @@ print("Response:", patched_ticket)
 
 print("\n=== SEARCH TICKETS ===")
 
-resp = requests.get(
+resp = session.get(
     f"{BASE}/tickets/search",
     params={"priority": 5},
 )
@@ -78,7 +71,7 @@ print("\nSearch by priority (5):")
 print("Status:", resp.status_code)
 print("Response:", resp.json())
 
-resp = requests.get(
+resp = session.get(
     f"{BASE}/tickets/search",
     params={"status": "in_progress"},
 )
@@ -86,7 +79,7 @@ print("\nSearch by status (in_progress):")
 print("Status:", resp.status_code)
 print("Response:", resp.json())
 
-resp = requests.get(
+resp = session.get(
     f"{BASE}/tickets/search",
     params={"priority": 2, "status": "open"},
 )
@@ -100,7 +93,7 @@ print("Response:", resp.json())
 
 print("\n=== DELETE TICKET ===")
 
-resp = requests.delete(
+resp = session.delete(
     f"{BASE}/tickets/{ticket2['id']}"
 )
 print(f"\nDelete ticket {ticket2['id']}:")
@@ -113,7 +106,7 @@ print("Response:", resp.json())
 
 print("\n=== VERIFY DELETE ===")
 
-resp = requests.get(
+resp = session.get(
     f"{BASE}/tickets/{ticket2['id']}"
 )
 print(f"\nGet deleted ticket {ticket2['id']}:")
@@ -1,32 +1,67 @@
 # uvicorn main:app --reload
 
-from fastapi import FastAPI, HTTPException, Depends, Query
-from sqlmodel import Field, Session, SQLModel, create_engine, select
-from typing import Annotated
-from enum import Enum
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager, suppress
+
+import msgspec
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from sqlalchemy import Index, String, bindparam, column, event, func, literal_column, table
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import Field, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Annotated, Literal
+
+
+logger = logging.getLogger(__name__)
 
 
 # Allowed lifecycle states for a ticket.
-# Using an Enum:
+# Using a Literal:
 # - restricts values to known states
-# - gives automatic validation
+# - gives automatic validation (a cheap set-membership check, unlike an Enum)
 # - improves API docs (/docs)
-class TicketStatus(str, Enum):
-    open = "open"
-    in_progress = "in_progress"
-    closed = "closed"
+TicketStatus = Literal["open", "in_progress", "closed"]
+
+
+# Pydantic settings shared by all ticket models.
+# These spell out the cheap options explicitly so nothing slower gets
+# switched on by accident:
+# - from_attributes: models can be built straight from ORM objects
+# - validate_assignment=False: setting an attribute doesn't re-run validation
+# - revalidate_instances="never": model instances passed into another model
+#   are reused as-is instead of being copied and validated again
+# - str_strip_whitespace=False: strings aren't walked to strip whitespace
+# - defer_build=False: validators are built at import, not on first use
+ticket_model_config = ConfigDict(
+    from_attributes=True,
+    validate_assignment=False,
+    arbitrary_types_allowed=False,
+    revalidate_instances="never",
+    str_strip_whitespace=False,
+    defer_build=False,
+)
 
 
 # Shared fields for a ticket.
 # This base model is reused by multiple schemas so we don't repeat ourselves.
 # NOTE: This does NOT represent a database table by itself.
 class TicketBase(SQLModel):
+    model_config = ticket_model_config
+
     title: str
     description: str
     # User-provided urgency, validated to be within a reasonable range
     priority: int = Field(ge=1, le=5)
     # System-controlled lifecycle state (defaults to "open")
-    status: TicketStatus = TicketStatus.open
+    # Stored as a plain string column; "in_progress" is the longest value
+    status: TicketStatus = Field(default="open", sa_type=String(11))
 
 
 # Database model (ORM).
@@ -36,6 +71,49 @@ class Ticket(TicketBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
 
 
+# Index on lower(title) so case-insensitive title lookups in the search
+# endpoint can use an index instead of scanning the whole table.
+Index("ix_title_nocase", func.lower(Ticket.title))
+
+# Composite index for the priority/status filters in the search endpoint.
+# priority comes first since it is the more selective column, and this way
+# priority-only searches can use the index as well.
+Index("ix_priority_status", Ticket.priority, Ticket.status)
+
+# Full-text index over ticket titles and descriptions (SQLite FTS5).
+# It is an "external content" table: the text stays in the ticket table
+# and the triggers below keep the index in sync with inserts/updates/deletes.
+tickets_fts_ddl = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts
+    USING fts5(title, description, content='ticket', content_rowid='id')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ai AFTER INSERT ON ticket BEGIN
+        INSERT INTO tickets_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ad AFTER DELETE ON ticket BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_au AFTER UPDATE OF title, description ON ticket BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tickets_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+)
+
+# Lightweight handle on the FTS table for building search queries.
+tickets_fts = table("tickets_fts", column("rowid"))
+
+
 # Public response model.
 # This defines the exact shape of ticket data returned to clients.
 # It includes the database-generated ID but excludes any internal-only fields.
@@ -43,10 +121,37 @@ class TicketPublic(TicketBase):
     id: int
 
 
+# Response model for one page of a ticket listing.
+# Pages are fetched with ?after_id=<next> (keyset pagination);
+# next is None once there are no more tickets.
+class TicketPage(SQLModel):
+    items: list[TicketPublic]
+    next: int | None
+
+
+# msgspec mirrors of TicketPublic / TicketPage.
+# The list endpoints use these to serialize pages of tickets, which is
+# much cheaper than going through Pydantic for every row.
+# Field order matches the Pydantic models so the JSON looks the same.
+class TicketPublicStruct(msgspec.Struct):
+    title: str
+    description: str
+    priority: int
+    status: str
+    id: int
+
+
+class TicketPageStruct(msgspec.Struct):
+    items: list[TicketPublicStruct]
+    next: int | None
+
+
 # Request model for creating a ticket.
 # This represents what a client is allowed to send when creating a ticket.
 # Status is intentionally excluded so new tickets always start in a valid state.
 class TicketCreate(SQLModel):
+    model_config = ticket_model_config
+
     title: str
     description: str
     priority: int = Field(ge=1, le=5)
@@ -56,6 +161,8 @@ class TicketCreate(SQLModel):
 # All fields are optional so clients can send partial updates.
 # Only provided fields will be applied to the existing database record.
 class TicketUpdate(SQLModel):
+    model_config = ticket_model_config
+
     title: str | None = None
     description: str | None = None
     priority: int | None = Field(default=None, ge=1, le=5)
@@ -66,29 +173,109 @@ class TicketUpdate(SQLModel):
 sqlite_file_name = "database.db"
 # SQLAlchemy connection URL for SQLite.
 # The triple slash (///) means "use a local file path".
-sqlite_url = f"sqlite:///{sqlite_file_name}"
-
-# SQLite is not thread-safe by default.
-# FastAPI can handle requests in multiple threads,
-# so we disable SQLite's same-thread check.
-connect_args = {"check_same_thread": False}
+# The aiosqlite driver runs SQLite calls off the event loop so they can be awaited.
+sqlite_url = f"sqlite+aiosqlite:///{sqlite_file_name}"
 
-# Create the SQLAlchemy engine.
+# Create the async SQLAlchemy engine.
 # The engine is the core object that manages database connections.
-engine = create_engine(sqlite_url, connect_args=connect_args)
+# The pool keeps several connections open so concurrent requests
+# don't all queue up behind a single shared connection.
+engine = create_async_engine(
+    sqlite_url,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=10,
+    max_overflow=20,
+)
+
+# PRAGMAs applied to every new SQLite connection the pool opens.
+# - WAL lets readers run alongside a writer instead of blocking on it
+# - synchronous=NORMAL is safe in WAL mode and avoids an fsync per commit
+# - temp_store / mmap_size / cache_size keep more work in memory
+# - busy_timeout makes a connection wait up to 5 seconds for a locked
+#   database before giving up, instead of failing immediately
+sqlite_pragmas = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
 
 
-def create_db_and_tables():
+# Connection events are emitted by the sync engine that the async engine wraps.
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection as soon as it is opened.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in sqlite_pragmas:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Factory for async sessions bound to the engine.
+# expire_on_commit=False keeps loaded attributes readable after commit,
+# since an async session can't lazily reload them on attribute access.
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def create_indexes(conn):
+    """
+    Create any ticket indexes that are missing from the database.
+
+    create_all() skips tables that already exist, along with their indexes,
+    so this makes sure indexes added later also exist in older databases.
+    """
+    for index in Ticket.__table__.indexes:
+        conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+async def create_db_and_tables():
     """
     Create all database tables defined by SQLModel models.
 
     This reads all classes that inherit from SQLModel with table=True
     (e.g., Ticket) and creates the corresponding tables if they do not exist.
     """
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(create_indexes)
+
+        # Set up the full-text index. If it is new, fill it from any tickets
+        # that already exist in the database.
+        result = await conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tickets_fts'"
+        )
+        fts_exists = result.first() is not None
+        for ddl in tickets_fts_ddl:
+            await conn.exec_driver_sql(ddl)
+        if not fts_exists:
+            await conn.exec_driver_sql(
+                "INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')"
+            )
+
+        # Gather table/index statistics so SQLite's query planner
+        # knows when the indexes are worth using.
+        await conn.exec_driver_sql("ANALYZE")
+
+
+def get_session_factory():
+    """
+    Provide the factory that database sessions are created from.
+
+    This function is used as a FastAPI dependency, so overriding it
+    (app.dependency_overrides) changes the database for every route.
+    """
+    return async_session
+
 
+# Type alias for injecting the session factory into route handlers.
+SessionFactoryDep = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
 
-def get_session():
+
+async def get_session(session_factory: SessionFactoryDep):
     """
     Provide a database session for a single request.
 
@@ -96,35 +283,297 @@ def get_session():
     A new session is created for each request and automatically
     closed when the request is finished.
     """
-    with Session(engine) as session:
+    async with session_factory() as session:
         yield session
 
 
 # Type alias for injecting a database session into route handlers.
 # This avoids repeating Depends(get_session) everywhere.
-SessionDep = Annotated[Session, Depends(get_session)]
+# The session is closed after the response has been sent (not when the
+# handler returns), so streaming routes can keep reading from it.
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
-# Create the FastAPI application instance.
-app = FastAPI(
-    title="Helpdesk API",
-    version="1.0.0",
-    description="A small REST API demonstrating CRUD + search + PATCH backed by SQLite."
+
+# Most items accepted in a list request body (e.g. POST /tickets/bulk).
+# A bulk insert holds SQLite's single write lock for its whole transaction,
+# so this keeps one request from blocking every other writer for long.
+max_body_items = 100
+
+
+def json_body(model: type[SQLModel], many: bool = False):
+    """
+    Build a FastAPI dependency that parses the request body into `model`
+    (or into a list of at most max_body_items `model`s when many=True).
+
+    validate_json() parses and validates the raw bytes in a single pass,
+    instead of FastAPI's default json.loads() followed by validating the
+    resulting dict. Errors are raised as RequestValidationError so clients
+    still get the usual 422 response.
+    """
+    if many:
+        adapter = TypeAdapter(Annotated[list[model], Field(max_length=max_body_items)])
+    else:
+        adapter = TypeAdapter(model)
+
+    async def parse_body(request: Request):
+        body = await request.body()
+        try:
+            return adapter.validate_json(body)
+        except ValidationError as exc:
+            errors = [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=body)
+
+    return Depends(parse_body)
+
+
+def json_body_docs(model: type[SQLModel], many: bool = False) -> dict:
+    """
+    OpenAPI description of a JSON request body parsed with json_body().
+
+    FastAPI can't see the body model through the dependency, so this keeps
+    it documented in /docs.
+    """
+    schema = model.model_json_schema()
+    if many:
+        schema = {"type": "array", "items": schema, "maxItems": max_body_items}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+# Type aliases for the validated request bodies.
+TicketCreateBody = Annotated[TicketCreate, json_body(TicketCreate)]
+TicketUpdateBody = Annotated[TicketUpdate, json_body(TicketUpdate)]
+TicketCreateListBody = Annotated[list[TicketCreate], json_body(TicketCreate, many=True)]
+
+
+def to_public(ticket: Ticket) -> TicketPublic:
+    """
+    Convert a ticket loaded from the database into the public response model.
+
+    Rows coming out of SQLite were already validated when they were written,
+    so model_construct() is used to skip running the validators again.
+    """
+    return TicketPublic.model_construct(**ticket.model_dump())
+
+
+# ASCII control characters (including NUL), which FTS5 can't handle
+# even inside a quoted string.
+control_chars = re.compile(r"[\x00-\x1f\x7f]")
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text from a client into an FTS5 MATCH expression.
+
+    Each word is quoted (so characters like '"' or '-' can't break the FTS5
+    query syntax) and matched as a prefix, e.g. "print jam" matches
+    "Printer keeps jamming". All words must match.
+    Control characters are removed; an empty string means there is nothing
+    to search for.
+    """
+    terms = [control_chars.sub("", term) for term in text.split()]
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms if term)
+
+
+# Serializers for the response models, built once at import time
+# instead of being set up by FastAPI for every request.
+# (The request body validators are built once in json_body().)
+ticket_adapter = TypeAdapter(TicketPublic)
+ticket_list_adapter = TypeAdapter(list[TicketPublic])
+
+# JSON encoder for the msgspec page structs, reused for every request.
+ticket_page_encoder = msgspec.json.Encoder()
+
+
+def ticket_json_response(ticket: Ticket) -> Response:
+    """
+    Serialize a single ticket straight to a JSON response.
+    """
+    return Response(
+        content=ticket_adapter.dump_json(to_public(ticket)),
+        media_type="application/json",
+    )
+
+
+def ticket_list_json_response(tickets: list[Ticket]) -> Response:
+    """
+    Serialize a list of tickets straight to a JSON response.
+    """
+    public_tickets = [to_public(ticket) for ticket in tickets]
+    return Response(
+        content=ticket_list_adapter.dump_json(public_tickets),
+        media_type="application/json",
+    )
+
+
+# Columns selected by the list endpoints.
+# Selecting plain columns returns lightweight rows instead of ORM objects,
+# so SQLAlchemy skips the identity map and change tracking for read-only lists.
+# They are in TicketPublicStruct field order, so a row maps onto it positionally.
+ticket_columns = (
+    Ticket.title,
+    Ticket.description,
+    Ticket.priority,
+    Ticket.status,
+    Ticket.id,
 )
 
 
-@app.on_event("startup")
-def on_startup():
+def build_search_stmt(by_priority: bool, by_status: bool):
     """
-    Run application startup tasks.
+    Build the search query for one combination of the priority/status filters.
+
+    Filter values, after_id and limit are bound parameters, so the same
+    statement object can be reused for every request with that combination.
+    """
+    stmt = select(*ticket_columns).where(Ticket.id > bindparam("after_id"))
+    if by_priority:
+        stmt = stmt.where(Ticket.priority == bindparam("priority"))
+    if by_status:
+        stmt = stmt.where(Ticket.status == bindparam("status"))
+    return stmt.order_by(Ticket.id).limit(bindparam("limit"))
+
+
+# Search statements built once at import time, keyed by
+# (priority filter given, status filter given).
+# Reusing them skips rebuilding the query (and SQLAlchemy's cache-key
+# generation for it) on every priority/status search.
+search_stmts = {
+    (by_priority, by_status): build_search_stmt(by_priority, by_status)
+    for by_priority in (False, True)
+    for by_status in (False, True)
+}
+
+
+def tickets_page_response(rows, limit: int) -> Response:
+    """
+    Serialize one page of ticket_columns rows straight to a JSON response.
+
+    The rows are wrapped in msgspec structs and encoded directly to JSON
+    bytes, skipping Pydantic and FastAPI's jsonable_encoder entirely.
+    """
+    public_tickets = [TicketPublicStruct(*row) for row in rows]
+    # A short page means we've reached the end, so there is no next page
+    next_id = public_tickets[-1].id if public_tickets and len(public_tickets) == limit else None
+    page = TicketPageStruct(items=public_tickets, next=next_id)
+    return Response(
+        content=ticket_page_encoder.encode(page),
+        media_type="application/json",
+    )
+
+
+# How many rows the search endpoint fetches from SQLite at a time while streaming.
+search_batch_size = 64
+
 
-    This ensures that the database tables exist
-    before the application starts handling requests.
+async def stream_tickets_page(result, limit: int):
     """
-    create_db_and_tables()
+    Stream an already-executed ticket_columns query as one JSON page.
+
+    Rows are fetched and encoded search_batch_size at a time, so only one
+    batch is held in memory and sending can start before all rows are read.
+    The output has the same shape as tickets_page_response().
+
+    The query is started by the route handler, so errors running it become
+    a normal 500 before the 200 status is sent. An error while reading
+    rows can only cut the response short, so it is logged here.
+    """
+    try:
+        yield b'{"items":['
+        count = 0
+        last_id = None
+        async for rows in result.partitions():
+            tickets = [TicketPublicStruct(*row) for row in rows]
+            if count:
+                yield b","
+            # Encoding the batch as a list and dropping the surrounding [ ]
+            # gives the comma-separated items
+            yield ticket_page_encoder.encode(tickets)[1:-1]
+            count += len(tickets)
+            last_id = tickets[-1].id
+        # A short page means we've reached the end, so there is no next page
+        next_id = last_id if count and count == limit else None
+        yield b'],"next":' + ticket_page_encoder.encode(next_id) + b"}"
+    except Exception:
+        logger.exception("Streaming search results failed")
+        raise
+
+
+# The ticket routes set response_model=None so FastAPI does not re-validate
+# what they return. These keep the response shapes in the API docs (/docs).
+ticket_response = {200: {"model": TicketPublic}}
+ticket_list_response = {200: {"model": list[TicketPublic]}}
+ticket_page_response = {200: {"model": TicketPage}}
+
+# How often (in seconds) the WAL file is checkpointed back into the database.
+wal_checkpoint_interval = 300
+
+
+async def checkpoint_wal_periodically():
+    """
+    Periodically copy the WAL file back into the main database file.
+
+    TRUNCATE also resets the WAL file to zero bytes, so it doesn't keep
+    growing while the app is running.
+    A failed checkpoint is logged and retried on the next interval, so one
+    error (e.g. a pool timeout under load) doesn't stop checkpointing.
+    """
+    while True:
+        await asyncio.sleep(wal_checkpoint_interval)
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception:
+            logger.exception("WAL checkpoint failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run application startup and shutdown tasks.
+
+    On startup this ensures that the database tables exist before the
+    application starts handling requests, opens a first pooled connection
+    so the first request doesn't pay for it, and starts WAL checkpointing.
+    On shutdown it lets SQLite update its statistics (PRAGMA optimize),
+    checkpoints the WAL and closes all pooled connections.
+    """
+    await create_db_and_tables()
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA optimize")
+
+    checkpoint_task = asyncio.create_task(checkpoint_wal_periodically())
+    try:
+        yield
+    finally:
+        checkpoint_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await checkpoint_task
+
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA optimize")
+            await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        await engine.dispose()
+
+
+# Create the FastAPI application instance.
+app = FastAPI(
+    title="Helpdesk API",
+    version="1.0.0",
+    description="A small REST API demonstrating CRUD + search + PATCH backed by SQLite.",
+    lifespan=lifespan,
+)
 
 
 @app.get("/")
-def root():
+async def root():
     return {
         "service": "helpdesk-api",
         "status": "ok",
@@ -133,111 +582,178 @@ def root():
 
 
 
-# Fast API reads the JSON body, uses Pydantic to validate types, and enforce constraints (priority 1-5), and constructs the Python object (JSON to Python)
-@app.post("/tickets/", response_model=TicketPublic) # The response_model enforces the type/shape of the object being returned
-def add_ticket(ticket: TicketCreate, session: SessionDep) -> TicketPublic:
+# json_body() reads the raw JSON body, Pydantic validates types and enforces constraints (priority 1-5), and constructs the Python object (JSON to Python)
+@app.post(
+    "/tickets/",
+    response_model=None,
+    responses=ticket_response,
+    openapi_extra=json_body_docs(TicketCreate),
+)
+async def add_ticket(ticket: TicketCreateBody, session: SessionDep) -> Response:
     # Now we need to convert from TicketCreate (input schema) to Ticket (database model)
-    db_ticket = Ticket.model_validate(ticket)
-    # The line above does the same as:
-    # db_ticket = Ticket(title=ticket.title, description=ticket.description, priority=ticket.priority)
+    # TicketCreate has already been validated, and table models don't re-run
+    # validation in __init__, so this just copies the fields across
+    db_ticket = Ticket(**ticket.__dict__)
     session.add(db_ticket) # add() tells the session that this object will be inserted into the database
-    session.commit() # commit() executes the SQL that adds the object to the database (id is auto generated)
-    session.refresh(db_ticket) # refresh() reloads the object from the database into Python memory. This is needed since the Python object may not know about the DB-generated field(s) (id in this case)
-    return db_ticket # Fast API looks at the response_model, so it knows the type being returned, and then returns the object (Python to JSON)
+    await session.commit() # commit() executes the SQL that adds the object to the database (id is auto generated)
+    # No refresh() needed: the INSERT hands the generated id straight back to SQLAlchemy,
+    # and expire_on_commit=False keeps the object's fields loaded after the commit
+    return ticket_json_response(db_ticket) # Convert the ticket to JSON (Python to JSON)
+
+
+# Create several tickets at once
+# All tickets are inserted in a single transaction, so there is one commit
+# (and one disk sync) for the whole batch instead of one per ticket.
+@app.post(
+    "/tickets/bulk",
+    response_model=None,
+    responses=ticket_list_response,
+    openapi_extra=json_body_docs(TicketCreate, many=True),
+)
+async def add_tickets(tickets: TicketCreateListBody, session: SessionDep) -> Response:
+    db_tickets = [Ticket(**ticket.__dict__) for ticket in tickets]
+    session.add_all(db_tickets)
+    # The ids are filled in when the inserts are flushed during commit
+    await session.commit()
+    return ticket_list_json_response(db_tickets)
 
 
 # Get all Tickets
-@app.get("/tickets/", response_model=list[TicketPublic])
-def read_tickets(
+# Largest id SQLite can store (a signed 64-bit integer). Larger after_id
+# values can't be bound as a query parameter, so they are rejected with a 422.
+max_ticket_id = 2**63 - 1
+
+
+# Tickets come back in id order; pass the previous page's "next" as after_id
+# to get the following page. Seeking by id stays fast however deep the page is,
+# unlike OFFSET which has to read and throw away every skipped row.
+@app.get("/tickets/", response_model=None, responses=ticket_page_response)
+async def read_tickets(
     session: SessionDep,
-    offset: int = 0,
-    limit: Annotated[int, Query(le=100)] = 100,
-) -> list[Ticket]:
-    tickets = session.exec(select(Ticket).offset(offset).limit(limit)).all()
-    return tickets
+    after_id: Annotated[int, Query(ge=0, le=max_ticket_id)] = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+) -> Response:
+    stmt = (
+        select(*ticket_columns)
+        .where(Ticket.id > after_id)
+        .order_by(Ticket.id)
+        .limit(limit)
+    )
+    result = await session.exec(stmt)
+    rows = result.all()
+    return tickets_page_response(rows, limit)
 
 # Search for a ticket via query parameters
-@app.get("/tickets/search", response_model=list[TicketPublic])
-def query_ticket_by_parameters(
+# NOTE: This route must stay above "/tickets/{ticket_id}". Routes are matched in
+# the order they are declared, so otherwise "search" would be parsed as a ticket_id.
+@app.get("/tickets/search", response_model=None, responses=ticket_page_response)
+async def query_ticket_by_parameters(
     session: SessionDep,
     title: str | None = None,
     description: str | None = None,
+    q: str | None = None,
     priority: int | None = Query(default=None, ge=1, le=5),
     status: TicketStatus | None = None,
-    offset: int = 0,
-    limit: int = Query(default=100, le=100),
-) -> list[Ticket]:
-    stmt = select(Ticket)
+    after_id: int = Query(default=0, ge=0, le=max_ticket_id),
+    limit: int = Query(default=100, ge=1, le=100),
+) -> StreamingResponse:
+    # Start from the prebuilt query for the priority/status filters that were provided
+    stmt = search_stmts[(priority is not None, status is not None)]
+    params = {"after_id": after_id, "limit": limit}
+    if priority is not None:
+        params["priority"] = priority
+    if status is not None:
+        params["status"] = status
 
-    # Build the search query
+    # Text filters are less common, so they are added to the query per request
     # Add filters only if the query param was provided
     if title is not None:
-        # Case-insensitive exact match
-        stmt = stmt.where(Ticket.title.ilike(title))
+        # Case-insensitive exact match (uses the lower(title) index)
+        stmt = stmt.where(func.lower(Ticket.title) == func.lower(title))
 
     if description is not None:
-        stmt = stmt.where(Ticket.description.ilike(description))
-
-    if priority is not None:
-        stmt = stmt.where(Ticket.priority == priority)
-
-    if status is not None:
-        stmt = stmt.where(Ticket.status == status)
+        stmt = stmt.where(func.lower(Ticket.description) == func.lower(description))
+
+    match_query = fts_query(q) if q is not None else ""
+    if match_query:
+        # Full-text search over title + description
+        # Results stay in id order (not rank) so they can be paged with after_id
+        stmt = stmt.join(tickets_fts, tickets_fts.c.rowid == Ticket.id).where(
+            literal_column("tickets_fts").match(match_query)
+        )
 
-    # Execute the search query
-    tickets = session.exec(stmt.offset(offset).limit(limit)).all()
-    return tickets
+    # Execute the search query before responding, so errors still give a 500.
+    # yield_per is passed here rather than set on the statement, so the shared
+    # prebuilt statements (and their cache keys) are reused as-is.
+    result = await session.stream(
+        stmt,
+        params=params,
+        execution_options={"yield_per": search_batch_size},
+    )
+    # Stream the results back as they are read
+    return StreamingResponse(
+        stream_tickets_page(result, limit),
+        media_type="application/json",
+    )
 
 
 # Get Ticket by id
-@app.get("/tickets/{ticket_id}", response_model=TicketPublic)
-def query_ticket_by_id(ticket_id: int, session: SessionDep) -> Ticket:
+@app.get("/tickets/{ticket_id}", response_model=None, responses=ticket_response)
+async def query_ticket_by_id(ticket_id: int, session: SessionDep) -> Response:
     # Search using the ticket's id, which is the primary key in the DB
-    ticket = session.get(Ticket, ticket_id)
+    ticket = await session.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(
             status_code=404, detail=f"Ticket with {ticket_id=} does not exist"
         )
-    return ticket
+    return ticket_json_response(ticket)
 
 
 # Update Ticket
-@app.patch("/tickets/{ticket_id}", response_model=TicketPublic)
-def update_ticket(
+@app.patch(
+    "/tickets/{ticket_id}",
+    response_model=None,
+    responses=ticket_response,
+    openapi_extra=json_body_docs(TicketUpdate),
+)
+async def update_ticket(
     ticket_id: int,
-    ticket: TicketUpdate,
+    ticket: TicketUpdateBody,
     session: SessionDep
-):
+) -> Response:
     # Grab the ticket we want to update from the DB
-    ticket_db = session.get(Ticket, ticket_id)
+    ticket_db = await session.get(Ticket, ticket_id)
     if not ticket_db:
         raise HTTPException(
             status_code=404, detail=f"Ticket with {ticket_id=} does not exist"
         )
-    # Pull ONLY the fields the user actually sent
-    ticket_data = ticket.model_dump(exclude_unset=True)
-    # Apply changes onto the DB object
-    ticket_db.sqlmodel_update(ticket_data)
+    # Apply ONLY the fields the user actually sent onto the DB object
+    # (model_fields_set is recorded during validation, so there is no need
+    # to dump the whole model just to find out which fields were provided)
+    # Every ticket column is required, so an explicit null leaves the field unchanged
+    for field_name in ticket.model_fields_set:
+        value = getattr(ticket, field_name)
+        if value is not None:
+            setattr(ticket_db, field_name, value)
     session.add(ticket_db)
-    session.commit()
-    session.refresh(ticket_db)
-    return ticket_db
+    await session.commit()
+    return ticket_json_response(ticket_db)
 
 
 # Delete Ticket
-@app.delete("/tickets/{ticket_id}", response_model=TicketPublic)
-def delete_ticket(
+@app.delete("/tickets/{ticket_id}", response_model=None, responses=ticket_response)
+async def delete_ticket(
     ticket_id: int,
     session: SessionDep
-) -> TicketPublic:
+) -> Response:
     # Get the ticket we want to delete from the DB
-    ticket = session.get(Ticket, ticket_id)
+    ticket = await session.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(
             status_code=404, detail=f"Ticket with {ticket_id=} does not exist"
         )
 
-    session.delete(ticket)
-    session.commit()
+    await session.delete(ticket)
+    await session.commit()
 
-    return ticket
\ No newline at end of file
+    return ticket_json_response(ticket)